@@ -3,17 +3,53 @@ AI pattern detection module
 Identifies common AI-generated writing patterns and phrases
 """
 
-import re
 from typing import Any
-from collections import defaultdict
-from functools import lru_cache
+from collections import OrderedDict
+from functools import cache
 import hashlib
+import threading
+
+import ahocorasick
+
+# "İ" is the only code point whose lowercase form is longer than itself;
+# folding it to "i" first keeps match offsets aligned with the original text
+_LENGTH_PRESERVING_FOLD = str.maketrans({"İ": "i"})
+
+
+@cache
+def _compile_phrases(
+    phrases_by_category: tuple[tuple[str, tuple[str, ...]], ...]
+) -> tuple[ahocorasick.Automaton, tuple[str, ...], tuple[int, ...]]:
+    """
+    Build the Aho-Corasick automaton and phrase lookup tables for a set of categories
+
+    Cached on the (category, phrases) structure so every detector sharing the
+    same patterns reuses one read-only automaton instead of rebuilding it.
+
+    Args:
+        phrases_by_category: Tuple of (category, phrases) pairs
+
+    Returns:
+        Tuple of (automaton, phrase_texts, phrase_category_ids). The automaton
+        maps each lowercased phrase to an integer phrase id that indexes both
+        tuples; category ids follow the order of phrases_by_category.
+    """
+    automaton = ahocorasick.Automaton()
+    phrase_texts = []
+    phrase_category_ids = []
+    for category_id, (_, phrases) in enumerate(phrases_by_category):
+        for phrase in phrases:
+            automaton.add_word(phrase.lower(), len(phrase_texts))
+            phrase_texts.append(phrase)
+            phrase_category_ids.append(category_id)
+    automaton.make_automaton()
+    return automaton, tuple(phrase_texts), tuple(phrase_category_ids)
 
 
 class AIPatternDetector:
     """Detects AI-generated writing patterns in text"""
     
-    # AI phrase patterns organized by category and weight
+    # AI phrase patterns organized by category, weight, and confidence level
     AI_PATTERNS = {
         "dead_giveaways": {
             "phrases": [
@@ -24,7 +60,8 @@ class AIPatternDetector:
                 "navigating the complexities", "navigate the complex",
                 "unlock the potential", "unlocking insights"
             ],
-            "weight": 3.0
+            "weight": 3.0,
+            "confidence": "Very High"
         },
         "high_probability": {
             "phrases": [
@@ -36,7 +73,8 @@ class AIPatternDetector:
                 "in conclusion", "to summarize", "in summary",
                 "leverage", "utilize", "paramount", "plethora"
             ],
-            "weight": 2.0
+            "weight": 2.0,
+            "confidence": "High"
         },
         "moderate_indicators": {
             "phrases": [
@@ -46,7 +84,8 @@ class AIPatternDetector:
                 "it should be noted", "bear in mind",
                 "synergy", "holistic", "paradigm"
             ],
-            "weight": 1.0
+            "weight": 1.0,
+            "confidence": "Medium"
         },
         "structural_patterns": {
             "phrases": [
@@ -55,9 +94,19 @@ class AIPatternDetector:
                 "broadly speaking", "generally speaking",
                 "for instance", "for example",
             ],
-            "weight": 0.5
+            "weight": 0.5,
+            "confidence": "Low"
         }
     }
+
+    # Texts shorter than this are used as their own cache key
+    _CACHE_KEY_HASH_THRESHOLD = 1024
+
+    # Maximum number of analysis results kept per detector
+    _CACHE_MAX_SIZE = 128
+
+    # Texts with fewer words than this score 0 without being scanned
+    MIN_WORDS_FOR_SCORING = 3
     
     def __init__(self):
         """Initialize the AI pattern detector"""
@@ -67,99 +116,175 @@ class AIPatternDetector:
             "high": 1.3
         }
 
-        # Pre-compile regex patterns for better performance
-        self._compiled_patterns = {}
-        for category, data in self.AI_PATTERNS.items():
-            self._compiled_patterns[category] = [
-                (phrase, re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE))
-                for phrase in data["phrases"]
-            ]
+        # Sensitivity-adjusted weight per category, precomputed for each level
+        self._weights_by_sensitivity = {
+            level: {category: data["weight"] * multiplier for category, data in self.AI_PATTERNS.items()}
+            for level, multiplier in self.sensitivity_multipliers.items()
+        }
+
+        # A single Aho-Corasick automaton over every phrase lets the text be
+        # scanned once regardless of how many phrases we track. It is shared
+        # by all detectors with the same AI_PATTERNS and reports integer phrase
+        # ids, so per-match lookups are plain tuple indexing.
+        self._automaton, self._phrase_texts, self._phrase_category_ids = _compile_phrases(tuple(
+            (category, tuple(data["phrases"])) for category, data in self.AI_PATTERNS.items()
+        ))
+
+        # Texts shorter than the shortest phrase can't contain any pattern
+        self._min_phrase_len = min(
+            len(phrase) for data in self.AI_PATTERNS.values() for phrase in data["phrases"]
+        )
+
+        # LRU cache of complete analysis results keyed by _get_cache_key,
+        # locked because the server runs analyses on worker threads
+        self._cache: OrderedDict[tuple[str | bytes, str, bool], dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def rebuild_patterns(cls, new_patterns: dict[str, dict[str, Any]]) -> None:
+        """
+        Replace the phrase patterns used by this detector class
+
+        AI_PATTERNS is treated as frozen once detectors exist; use this instead
+        of mutating it in place. Only detectors created afterwards see the new
+        patterns, existing instances keep their automaton and cached results.
+
+        Args:
+            new_patterns: Mapping in the same shape as AI_PATTERNS
+        """
+        cls.AI_PATTERNS = new_patterns
+        _compile_phrases.cache_clear()
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        """Check whether a character counts as part of a word (mirrors regex \\w)"""
+        return char.isalnum() or char == "_"
     
-    def detect_patterns(self, text: str, sensitivity: str = "medium") -> tuple[float, list[dict[str, Any]]]:
+    def detect_patterns(
+        self,
+        text: str,
+        sensitivity: str = "medium",
+        include_context: bool = True
+    ) -> tuple[float, list[dict[str, Any]]]:
         """
         Detect AI patterns in text and calculate AI likelihood score
 
         Args:
             text: The text to analyze
             sensitivity: Detection sensitivity level (low/medium/high)
+            include_context: Attach a surrounding-text snippet to each match.
+                            Score-only callers can pass False to skip building them.
 
         Returns:
             Tuple of (ai_score, list_of_patterns_found)
         """
+        ai_score, patterns_found, _, _ = self._scan(text, sensitivity, include_context)
+        return ai_score, patterns_found
+
+    def _scan(
+        self,
+        text: str,
+        sensitivity: str,
+        include_context: bool
+    ) -> tuple[float, list[dict[str, Any]], dict[str, int], set[str]]:
+        """
+        Run pattern detection and also return the per-category counts and set
+        of matched phrases collected along the way, so analyze can hand them to
+        get_recommendations without a second walk over every match
+
+        Returns:
+            Tuple of (ai_score, patterns_found, category_counts, matched_phrases)
+        """
+        # Skip the scan for texts too short to hold a phrase, or with too few
+        # words for a density-based score to mean anything
+        if len(text) < self._min_phrase_len:
+            return 0.0, [], {}, set()
+        word_count = len(text.split())
+        if word_count < self.MIN_WORDS_FOR_SCORING:
+            return 0.0, [], {}, set()
+
         patterns_found = []
+        category_counts = {}
         total_score = 0
 
-        # Get sensitivity multiplier
-        multiplier = self.sensitivity_multipliers.get(sensitivity, 1.0)
+        # Get sensitivity-adjusted category weights
+        weights = self._weights_by_sensitivity.get(sensitivity, self._weights_by_sensitivity["medium"])
 
-        # Check each category of patterns using pre-compiled regex
-        for category, data in self.AI_PATTERNS.items():
-            category_matches = []
+        # Single pass over the lowercased text; every phrase is found at once
+        low = text.lower()
+        if len(low) != len(text):
+            low = text.translate(_LENGTH_PRESERVING_FOLD).lower()
+        text_len = len(text)
+        phrase_texts = self._phrase_texts
+        phrase_category_ids = self._phrase_category_ids
+        matches_by_category = [[] for _ in self.AI_PATTERNS]
+        phrase_seen = bytearray(len(phrase_texts))
 
-            for phrase, pattern in self._compiled_patterns[category]:
-                # Find all matches using pre-compiled pattern
-                matches = pattern.finditer(text)
+        for end_idx, phrase_id in self._automaton.iter(low):
+            phrase = phrase_texts[phrase_id]
+            start = end_idx - len(phrase) + 1
+            end = end_idx + 1
 
-                for match in matches:
-                    # Get context around the match
-                    start = max(0, match.start() - 30)
-                    end = min(len(text), match.end() + 30)
-                    context = text[start:end].strip()
+            # Enforce word boundaries on both sides of the match
+            if start > 0 and self._is_word_char(low[start - 1]):
+                continue
+            if end < text_len and self._is_word_char(low[end]):
+                continue
 
-                    # Add ellipsis if truncated
-                    if start > 0:
-                        context = "..." + context
-                    if end < len(text):
-                        context = context + "..."
+            phrase_seen[phrase_id] = 1
+            category_matches = matches_by_category[phrase_category_ids[phrase_id]]
+            if not include_context:
+                category_matches.append({"phrase": phrase, "position": start})
+                continue
 
-                    category_matches.append({
-                        "phrase": phrase,
-                        "context": context,
-                        "position": match.start()
-                    })
+            # Get context around the match
+            ctx_start = max(0, start - 30)
+            ctx_end = min(text_len, end + 30)
+            context = text[ctx_start:ctx_end].strip()
 
-                    # Add to total score
-                    total_score += data["weight"] * multiplier
+            # Add ellipsis if truncated
+            if ctx_start > 0:
+                context = "..." + context
+            if ctx_end < text_len:
+                context = context + "..."
 
+            category_matches.append({
+                "phrase": phrase,
+                "context": context,
+                "position": start
+            })
+
+        # Report categories in their declared order
+        for (category, data), category_matches in zip(self.AI_PATTERNS.items(), matches_by_category):
             if category_matches:
+                category_counts[category] = len(category_matches)
+                total_score += weights[category] * len(category_matches)
                 patterns_found.append({
                     "category": category,
-                    "confidence": self._get_confidence_level(category),
+                    "confidence": data["confidence"],
                     "matches": category_matches,
                     "count": len(category_matches)
                 })
         
         # Calculate final AI score (0-100)
         # Use pattern density normalized per 100 words for consistent scoring
-        word_count = len(text.split())
-        if word_count > 0:
-            # Calculate pattern density (patterns per 100 words)
-            # This makes scoring consistent regardless of text length
-            pattern_density = (total_score / word_count) * 100
-
-            # Scale to 0-100 range with a reasonable curve
-            # Score of 15+ in density maps to ~100, Score of 3 maps to ~50
-            ai_score = min(100, pattern_density * 6.5)
-
-            # For very short texts (< 50 words), apply a small confidence penalty
-            # to account for statistical insignificance
-            if word_count < 50:
-                confidence_factor = word_count / 50  # 0.2 to 1.0
-                ai_score = ai_score * (0.7 + 0.3 * confidence_factor)
-        else:
-            ai_score = 0
+        # Calculate pattern density (patterns per 100 words)
+        # This makes scoring consistent regardless of text length
+        pattern_density = (total_score / word_count) * 100
+
+        # Scale to 0-100 range with a reasonable curve
+        # Score of 15+ in density maps to ~100, Score of 3 maps to ~50
+        ai_score = min(100, pattern_density * 6.5)
+
+        # For very short texts (< 50 words), apply a small confidence penalty
+        # to account for statistical insignificance
+        if word_count < 50:
+            confidence_factor = word_count / 50  # 0.06 to 1.0
+            ai_score = ai_score * (0.7 + 0.3 * confidence_factor)
+
+        matched_phrases = {phrase_texts[phrase_id] for phrase_id, seen in enumerate(phrase_seen) if seen}
         
-        return ai_score, patterns_found
-    
-    def _get_confidence_level(self, category: str) -> str:
-        """Get human-readable confidence level for a category"""
-        confidence_map = {
-            "dead_giveaways": "Very High",
-            "high_probability": "High",
-            "moderate_indicators": "Medium",
-            "structural_patterns": "Low"
-        }
-        return confidence_map.get(category, "Unknown")
+        return ai_score, patterns_found, category_counts, matched_phrases
     
     def interpret_ai_score(self, score: float) -> str:
         """Interpret the AI likelihood score"""
@@ -174,28 +299,33 @@ class AIPatternDetector:
         else:
             return "Very high - Multiple strong AI patterns found"
     
-    def get_recommendations(self, patterns_found: list[dict[str, Any]], ai_score: float) -> list[str]:
+    def get_recommendations(
+        self,
+        patterns_found: list[dict[str, Any]],
+        ai_score: float,
+        category_counts: dict[str, int] | None = None,
+        phrase_set: set[str] | None = None
+    ) -> list[str]:
         """
         Generate specific recommendations based on patterns found
         
         Args:
             patterns_found: List of detected patterns
             ai_score: Overall AI likelihood score
+            category_counts: Optional precomputed match count per category
+            phrase_set: Optional precomputed set of distinct matched phrases
         
         Returns:
             List of specific improvement recommendations
         """
         tips = []
         
-        # Count patterns by category
-        category_counts = defaultdict(int)
-        all_phrases = []
-        
-        for pattern_group in patterns_found:
-            category = pattern_group["category"]
-            category_counts[category] = pattern_group["count"]
-            for match in pattern_group["matches"]:
-                all_phrases.append(match["phrase"])
+        # Count patterns by category and collect the distinct phrases seen,
+        # unless the caller already has them from detection
+        if category_counts is None:
+            category_counts = {group["category"]: group["count"] for group in patterns_found}
+        if phrase_set is None:
+            phrase_set = {match["phrase"] for group in patterns_found for match in group["matches"]}
         
         # Specific recommendations based on patterns
         if category_counts.get("dead_giveaways", 0) > 0:
@@ -206,14 +336,14 @@ class AIPatternDetector:
             tips.append("Reduce formal transitions - try starting sentences directly with your point")
             tips.append("Replace 'moreover/furthermore' with 'also' or just connect ideas naturally")
         
-        if "it's important to note" in all_phrases or "it's worth noting" in all_phrases:
+        if phrase_set & {"it's important to note", "it's worth noting"}:
             tips.append("Remove meta-commentary like 'it's important to note' - just state the point")
         
         if category_counts.get("structural_patterns", 0) > 3:
             tips.append("Vary your paragraph structure - avoid rigid firstly/secondly/thirdly patterns")
         
         # Check for overuse of certain word types
-        if any(phrase in all_phrases for phrase in ["leverage", "utilize", "comprehensive", "robust"]):
+        if phrase_set & {"leverage", "utilize", "comprehensive", "robust"}:
             tips.append("Simplify business jargon: 'use' instead of 'utilize', 'strong' instead of 'robust'")
         
         # General recommendations based on score
@@ -227,25 +357,38 @@ class AIPatternDetector:
         
         return tips
     
-    def analyze(self, text: str, sensitivity: str = "medium") -> dict[str, Any]:
+    def analyze(
+        self,
+        text: str,
+        sensitivity: str = "medium",
+        include_recommendations: bool = True
+    ) -> dict[str, Any]:
         """
         Complete AI pattern analysis with optional caching for identical texts
 
         Args:
             text: The text to analyze
             sensitivity: Detection sensitivity (low/medium/high)
+            include_recommendations: Generate writing recommendations. When False
+                                    the "recommendations" list is left empty.
 
         Returns:
             Dictionary containing AI score, patterns, and recommendations
         """
         # Use cached analysis for identical text+sensitivity combinations
         # This helps when analyzing the same text multiple times
-        cache_key = self._get_cache_key(text, sensitivity)
-        cached_result = self._get_cached_result(cache_key)
+        cache_key = self._get_cache_key(text, sensitivity, include_recommendations)
+        # Callers get shallow copies so they can't replace the cached entry's keys
+        with self._cache_lock:
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
+                self._cache.move_to_end(cache_key)
         if cached_result is not None:
-            return cached_result
+            return dict(cached_result)
 
-        ai_score, patterns_found = self.detect_patterns(text, sensitivity)
+        ai_score, patterns_found, category_counts, matched_phrases = self._scan(
+            text, sensitivity, include_context=True
+        )
 
         result = {
             "ai_likelihood_score": round(ai_score, 1),
@@ -256,26 +399,29 @@ class AIPatternDetector:
                 "categories_triggered": len(patterns_found),
                 "most_common_category": max(patterns_found, key=lambda x: x["count"])["category"] if patterns_found else None
             },
-            "recommendations": self.get_recommendations(patterns_found, ai_score),
+            "recommendations": self.get_recommendations(
+                patterns_found, ai_score, category_counts=category_counts, phrase_set=matched_phrases
+            ) if include_recommendations else [],
             "sensitivity_used": sensitivity
         }
 
-        self._cache_result(cache_key, result)
-        return result
+        with self._cache_lock:
+            self._cache[cache_key] = result
+            if len(self._cache) > self._CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+        return dict(result)
 
     @staticmethod
-    def _get_cache_key(text: str, sensitivity: str) -> str:
-        """Generate a cache key for text and sensitivity combination"""
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        return f"{text_hash}:{sensitivity}"
-
-    @lru_cache(maxsize=128)
-    def _get_cached_result(self, cache_key: str) -> dict[str, Any] | None:
-        """Get cached result if available (using LRU cache)"""
-        return None  # Placeholder that gets replaced by LRU cache
-
-    def _cache_result(self, cache_key: str, result: dict[str, Any]) -> None:
-        """Cache a result (handled by LRU cache decorator)"""
-        # This is a workaround since we can't directly cache complex return values
-        # The actual caching is done at a higher level
-        pass
\ No newline at end of file
+    def _get_cache_key(
+        text: str,
+        sensitivity: str,
+        include_recommendations: bool
+    ) -> tuple[str | bytes, str, bool]:
+        """Generate a cache key for a text and analysis options combination"""
+        # Short texts are cheaper to use directly than to hash
+        if len(text) < AIPatternDetector._CACHE_KEY_HASH_THRESHOLD:
+            return text, sensitivity, include_recommendations
+        # Non-cryptographic use: blake2b is faster than md5 on 64-bit builds.
+        # The raw bytes digest can never collide with a str key above.
+        text_hash = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        return text_hash, sensitivity, include_recommendations
@@ -6,6 +6,9 @@ Provides various readability metrics and scoring functions
 import textstat
 from typing import Any
 from src.models.results import ReadabilityResult
+from src.analyzers.syllables import enable_syllable_cache
+
+enable_syllable_cache()
 
 
 class ReadabilityAnalyzer:
@@ -5,8 +5,18 @@ Identifies and analyzes complex sentences in text
 
 import textstat
 import nltk
+from functools import lru_cache
 from typing import Any
-from src.models.results import DifficultSentence
+from src.models.results import DifficultSentence, SentenceAnalysisResult
+from src.analyzers.syllables import enable_syllable_cache
+
+enable_syllable_cache()
+
+
+@lru_cache(maxsize=32)
+def _tokenize_sentences(text: str) -> tuple[str, ...]:
+    """Split text into sentences, caching recent texts to skip re-tokenizing"""
+    return tuple(nltk.sent_tokenize(text))
 
 
 class SentenceAnalyzer:
@@ -83,18 +93,42 @@ class SentenceAnalyzer:
         Returns:
             List of difficult sentences with analysis
         """
+        return self.analyze_sentences(text, count, threshold).difficult_sentences
+    
+    def analyze_sentences(self, text: str, count: int = 5, threshold: float = 10.0) -> SentenceAnalysisResult:
+        """
+        Find the most difficult sentences along with whole-text sentence statistics
+        
+        Every sentence is tokenized and graded once, so the sentence count and
+        average grade level come from the same pass as the difficult sentences.
+        
+        Args:
+            text: The text to analyze
+            count: Number of difficult sentences to return
+            threshold: Minimum grade level to be considered difficult
+        
+        Returns:
+            SentenceAnalysisResult with the top difficult sentences, total
+            sentence count, and average grade level
+        """
         # Tokenize into sentences
-        sentences = nltk.sent_tokenize(text)
+        sentences = _tokenize_sentences(text)
         
         # Analyze each sentence
         sentence_data = []
+        total_grade = 0.0
         for i, sentence in enumerate(sentences):
             # Skip very short sentences
-            if len(sentence.strip()) < 10:
+            stripped_length = len(sentence.strip())
+            if stripped_length < 10:
                 continue
             
             grade_level, issues = self.analyze_sentence_difficulty(sentence)
             
+            # Sentences of exactly 10 characters are analyzed but left out of the average
+            if stripped_length > 10:
+                total_grade += grade_level
+            
             # Only include sentences above threshold
             if grade_level >= threshold:
                 word_count = textstat.lexicon_count(sentence, removepunct=True)
@@ -122,4 +156,8 @@ class SentenceAnalyzer:
         sentence_data.sort(key=lambda x: x["grade_level"], reverse=True)
         
         # Return top N sentences
-        return sentence_data[:count]
\ No newline at end of file
+        return SentenceAnalysisResult(
+            difficult_sentences=sentence_data[:count],
+            total_sentences=len(sentences),
+            average_grade_level=total_grade / len(sentences) if sentences else 0
+        )
@@ -0,0 +1,27 @@
+"""
+Syllable counting cache
+Memoizes the per-word hyphenation lookup that textstat's syllable counts rely on
+"""
+
+from functools import lru_cache
+from pyphen import Pyphen
+
+# English text is Zipfian: a few thousand word types cover nearly every token
+SYLLABLE_CACHE_SIZE = 100_000
+
+
+def enable_syllable_cache(maxsize: int = SYLLABLE_CACHE_SIZE) -> None:
+    """
+    Wrap Pyphen.positions in an LRU cache
+
+    Every textstat syllable count (and the grade formulas built on it) ends up
+    calling Pyphen.positions once per word, so caching there speeds up all
+    metrics without depending on textstat's internal layout. Safe to call more
+    than once; only the first call installs the cache.
+
+    Args:
+        maxsize: Maximum number of (dictionary, word) entries to keep
+    """
+    if hasattr(Pyphen.positions, "cache_info"):
+        return
+    Pyphen.positions = lru_cache(maxsize=maxsize)(Pyphen.positions)
@@ -2,6 +2,6 @@
 Data models and structures for the readability server
 """
 
-from .results import ReadabilityResult, DifficultSentence, AIDetectionResult
+from .results import ReadabilityResult, DifficultSentence, SentenceAnalysisResult, AIDetectionResult
 
-__all__ = ['ReadabilityResult', 'DifficultSentence', 'AIDetectionResult']
\ No newline at end of file
+__all__ = ['ReadabilityResult', 'DifficultSentence', 'SentenceAnalysisResult', 'AIDetectionResult']
\ No newline at end of file
@@ -29,6 +29,14 @@ class DifficultSentence:
     syllable_count: int
 
 
+@dataclass
+class SentenceAnalysisResult:
+    """Structure for whole-text sentence difficulty analysis"""
+    difficult_sentences: list[dict[str, Any]]
+    total_sentences: int
+    average_grade_level: float
+
+
 @dataclass
 class AIDetectionResult:
     """Structure for AI pattern detection results"""
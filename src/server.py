@@ -4,8 +4,10 @@ Readability MCP Server
 Main server module that exposes MCP tools for text analysis
 """
 
+import asyncio
 import logging
 from typing import Any
+import textstat
 from fastmcp import FastMCP
 
 from src.analyzers import ReadabilityAnalyzer, SentenceAnalyzer, AIPatternDetector
@@ -22,11 +24,43 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize analyzers
+# These are synchronous and CPU-bound, so tools call them through
+# asyncio.to_thread to keep the event loop free for concurrent requests
 readability_analyzer = ReadabilityAnalyzer()
 sentence_analyzer = SentenceAnalyzer()
 ai_detector = AIPatternDetector()
 
 
+def _analyze_batch_item(idx: int, text: str, analysis_set: set[str]) -> dict[str, Any]:
+    """
+    Run the requested analyses on a single batch text
+
+    Args:
+        idx: Position of the text in the batch
+        text: The validated text to analyze
+        analysis_set: Analysis types to run (readability, sentences, ai_patterns)
+
+    Returns:
+        Per-text result dictionary for batch_analyze
+    """
+    result = {"text_index": idx}
+
+    if "readability" in analysis_set:
+        result["readability"] = readability_analyzer.analyze(text)
+
+    if "sentences" in analysis_set:
+        difficult = sentence_analyzer.find_difficult_sentences(text, count=3)
+        result["difficult_sentences"] = {
+            "count": len(difficult),
+            "sentences": difficult
+        }
+
+    if "ai_patterns" in analysis_set:
+        result["ai_detection"] = ai_detector.analyze(text)
+
+    return result
+
+
 @mcp.tool()
 async def analyze_text(text: str, metrics: list[str] | None = None) -> dict[str, Any]:
     """
@@ -60,7 +94,7 @@ async def analyze_text(text: str, metrics: list[str] | None = None) -> dict[str,
         if metrics is not None:
             metrics = validate_metrics(metrics)
 
-        result = readability_analyzer.analyze(text, metrics)
+        result = await asyncio.to_thread(readability_analyzer.analyze, text, metrics)
         logger.info(f"Analyzed text with {result['statistics']['word_count']} words")
         return result
     except ValidationError as e:
@@ -119,23 +153,21 @@ async def find_hard_sentences(
         count = validate_count(count)
         threshold = validate_threshold(threshold)
 
-        difficult_sentences = sentence_analyzer.find_difficult_sentences(text, count, threshold)
-
-        # Calculate average grade level for context
-        import nltk
-        import textstat
-        sentences = nltk.sent_tokenize(text)
-        total_grade = sum(textstat.flesch_kincaid_grade(s) for s in sentences if len(s.strip()) > 10)
-        avg_grade = total_grade / len(sentences) if sentences else 0
+        analysis = await asyncio.to_thread(
+            sentence_analyzer.analyze_sentences, text, count, threshold
+        )
 
         result = {
-            "difficult_sentences": difficult_sentences,
-            "total_sentences": len(sentences),
-            "average_grade_level": round(avg_grade, 1),
+            "difficult_sentences": analysis.difficult_sentences,
+            "total_sentences": analysis.total_sentences,
+            "average_grade_level": round(analysis.average_grade_level, 1),
             "threshold_used": threshold
         }
 
-        logger.info(f"Found {len(difficult_sentences)} difficult sentences out of {len(sentences)}")
+        logger.info(
+            f"Found {len(analysis.difficult_sentences)} difficult sentences "
+            f"out of {analysis.total_sentences}"
+        )
         return result
 
     except ValidationError as e:
@@ -149,7 +181,8 @@ async def find_hard_sentences(
 @mcp.tool()
 async def check_ai_phrases(
     text: str,
-    sensitivity: str = "medium"
+    sensitivity: str = "medium",
+    include_recommendations: bool = True
 ) -> dict[str, Any]:
     """
     Check text for common AI-generated writing patterns
@@ -158,6 +191,9 @@ async def check_ai_phrases(
         text: The text to analyze (1-500,000 characters)
         sensitivity: Detection sensitivity - "low", "medium", or "high" (default: "medium")
                     Higher sensitivity catches more patterns but may have false positives
+        include_recommendations: Generate writing recommendations (default: True).
+                                Set to False for faster score-only screening; the
+                                recommendations list is then returned empty
 
     Returns:
         Dictionary containing:
@@ -185,7 +221,9 @@ async def check_ai_phrases(
         text = validate_text(text)
         sensitivity = validate_sensitivity(sensitivity)
 
-        result = ai_detector.analyze(text, sensitivity)
+        result = await asyncio.to_thread(
+            ai_detector.analyze, text, sensitivity, include_recommendations=include_recommendations
+        )
 
         logger.info(
             f"AI detection complete: score={result['ai_likelihood_score']}, "
@@ -265,22 +303,7 @@ async def batch_analyze(texts: list[str], analysis_types: list[str] | None = Non
         results = []
         for idx, text in enumerate(texts):
             text = validate_text(text)
-            result = {"text_index": idx}
-
-            if "readability" in analysis_set:
-                result["readability"] = readability_analyzer.analyze(text)
-
-            if "sentences" in analysis_set:
-                difficult = sentence_analyzer.find_difficult_sentences(text, count=3)
-                result["difficult_sentences"] = {
-                    "count": len(difficult),
-                    "sentences": difficult
-                }
-
-            if "ai_patterns" in analysis_set:
-                result["ai_detection"] = ai_detector.analyze(text)
-
-            results.append(result)
+            results.append(await asyncio.to_thread(_analyze_batch_item, idx, text, analysis_set))
 
         # Calculate summary statistics
         summary = {}
@@ -348,11 +371,12 @@ async def compare_texts(
             comparison_aspects = ["readability", "ai_patterns", "sentence_complexity"]
 
         # Analyze both versions
-        orig_readability = readability_analyzer.analyze(original_text)
-        rev_readability = readability_analyzer.analyze(revised_text)
-
-        orig_ai = ai_detector.analyze(original_text)
-        rev_ai = ai_detector.analyze(revised_text)
+        orig_readability, rev_readability, orig_ai, rev_ai = await asyncio.gather(
+            asyncio.to_thread(readability_analyzer.analyze, original_text),
+            asyncio.to_thread(readability_analyzer.analyze, revised_text),
+            asyncio.to_thread(ai_detector.analyze, original_text, include_recommendations=False),
+            asyncio.to_thread(ai_detector.analyze, revised_text)
+        )
 
         # Calculate improvements and regressions
         improvements = []
@@ -448,8 +472,6 @@ async def health_check() -> dict[str, str]:
     Returns:
         Dictionary with server status and version information
     """
-    import textstat
-
     return {
         "status": "healthy",
         "version": "2.0.0",
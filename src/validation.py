@@ -40,9 +40,9 @@ def validate_text(text: str, min_length: int = 1, max_length: int = 500000) -> s
             f"(got {len(cleaned_text):,})"
         )
 
-    # Check if text contains actual words
-    word_count = len(cleaned_text.split())
-    if word_count == 0:
+    # Check if text contains actual words. After strip() any remaining
+    # character is non-whitespace, so this needs no split() into a word list
+    if not cleaned_text:
         raise ValidationError("Text must contain at least one word")
 
     return cleaned_text